@@ -44,6 +44,8 @@ class CIMTrajectory(Trajectory):
         self.time_decay = time_decay
         self.finite_vessel_space = finite_vessel_space
         self.has_early_discharge = has_early_discharge
+        # Per-port reward decay factors are the same for every event, so they are only built once.
+        self._decay_list = None
 
     def get_state(self, event):
         vessel_snapshots, port_snapshots = self.env.snapshot_list["vessels"], self.env.snapshot_list["ports"]
@@ -60,7 +62,7 @@ class CIMTrajectory(Trajectory):
         model_action = action_info[0] if isinstance(action_info, tuple) else action_info
         scope, tick, port, vessel = event.action_scope, event.tick, event.port_idx, event.vessel_idx
         zero_action_idx = len(self.action_space) / 2  # index corresponding to value zero.
-        vessel_space = vessel_snapshots[tick:vessel:self.vessel_attributes][2] if self.finite_vessel_space else float("inf")
+        vessel_space = vessel_snapshots[tick:vessel:"remaining_space"][0] if self.finite_vessel_space else float("inf")
         early_discharge = vessel_snapshots[tick:vessel:"early_discharge"][0] if self.has_early_discharge else 0
         percent = abs(self.action_space[model_action])
 
@@ -83,13 +85,14 @@ class CIMTrajectory(Trajectory):
 
         future_fulfillment = port_snapshots[ticks::"fulfillment"]
         future_shortage = port_snapshots[ticks::"shortage"]
-        decay_list = [
-            self.time_decay ** i for i in range(self.reward_time_window)
-            for _ in range(future_fulfillment.shape[0] // self.reward_time_window)
-        ]
+        if self._decay_list is None or len(self._decay_list) != future_fulfillment.shape[0]:
+            self._decay_list = np.repeat(
+                self.time_decay ** np.arange(self.reward_time_window),
+                future_fulfillment.shape[0] // self.reward_time_window
+            )
 
-        tot_fulfillment = np.dot(future_fulfillment, decay_list)
-        tot_shortage = np.dot(future_shortage, decay_list)
+        tot_fulfillment = np.dot(future_fulfillment, self._decay_list)
+        tot_shortage = np.dot(future_shortage, self._decay_list)
 
         return np.float32(self.fulfillment_factor * tot_fulfillment - self.shortage_factor * tot_shortage)
 
@@ -44,19 +44,7 @@ class BestFit(RuleBasedAlgorithm):
         elif self._metric_type == 'energy_consumption':
             chosen_idx = np.argmax(energy_consumption)
         elif self._metric_type == 'remaining_cpu_cores_and_energy_consumption':
-            maximum_energy_consumption = energy_consumption[0]
-            minimum_remaining_cpu_cores = cpu_cores_remaining[0]
-            for i, remaining in enumerate(cpu_cores_remaining):
-                energy = energy_consumption[i]
-                if (
-                        remaining < minimum_remaining_cpu_cores
-                        or (
-                            remaining == minimum_remaining_cpu_cores
-                            and energy > maximum_energy_consumption
-                        )
-                ):
-                    chosen_idx = i
-                    minimum_remaining_cpu_cores = remaining
-                    maximum_energy_consumption = energy
+            # Minimal remaining cpu cores first, then maximal energy consumption, then the smallest index.
+            chosen_idx = np.lexsort((-energy_consumption, cpu_cores_remaining))[0]
 
         return chosen_idx
@@ -19,14 +19,7 @@ class BinPacking(RuleBasedAlgorithm):
         self._pm_num: int = total_pm_cpu_info.shape[0]
         self._pm_cpu_core_num: int = int(np.max(total_pm_cpu_info) * self._max_cpu_oversubscription_rate)
 
-    def _init_bin(self):
-        self._bins = [[] for _ in range(self._pm_cpu_core_num + 1)]
-        self._bin_size = [0] * (self._pm_cpu_core_num + 1)
-
     def allocate_vm(self, decision_event: DecisionPayload, env: Env) -> AllocateAction:
-        # Initialize the bin.
-        self._init_bin()
-
         # Get the number of PM, maximum CPU core and max cpu oversubscription rate.
         total_pm_info = env.snapshot_list["pms"][
             env.frame_index::["cpu_cores_capacity", "cpu_cores_allocated"]
@@ -34,25 +27,21 @@ class BinPacking(RuleBasedAlgorithm):
 
         cpu_cores_remaining = total_pm_info[:, 0] * self._max_cpu_oversubscription_rate - total_pm_info[:, 1]
 
-        for i, cpu_core in enumerate(cpu_cores_remaining):
-            self._bins[int(cpu_core)].append(i)
-            self._bin_size[int(cpu_core)] += 1
+        # Group the PMs into bins by their remaining CPU cores.
+        bin_index = cpu_cores_remaining.astype(int)
+        self._bin_size = np.bincount(bin_index, minlength=self._pm_cpu_core_num + 1)
 
         # Choose a PM that minimize the variance of the PM number in each bin.
-        minimal_var = np.inf
+        # Moving a PM from bin r to bin r - cores_need keeps the mean bin size unchanged, so the new variance only
+        # differs by the sizes of these two bins and is minimal where bin_size[r - cores_need] - bin_size[r] is.
         cores_need = decision_event.vm_cpu_cores_requirement
 
         chosen_idx = 0
-        for remaining_cores in range(cores_need, len(self._bins)):
-            if self._bin_size[remaining_cores] != 0:
-                self._bin_size[remaining_cores] -= 1
-                self._bin_size[remaining_cores - cores_need] += 1
-                var = np.var(np.array(self._bin_size))
-                if minimal_var > var:
-                    minimal_var = var
-                    chosen_idx = random.choice(self._bins[remaining_cores])
-                self._bin_size[remaining_cores] += 1
-                self._bin_size[remaining_cores - cores_need] -= 1
+        candidate_bins = np.flatnonzero(self._bin_size[cores_need:]) + cores_need
+        if len(candidate_bins) > 0:
+            var_delta = self._bin_size[candidate_bins - cores_need] - self._bin_size[candidate_bins]
+            chosen_bin = candidate_bins[np.argmin(var_delta)]
+            chosen_idx = int(random.choice(np.flatnonzero(bin_index == chosen_bin)))
 
         # Take action to allocate on the chosen pm.
         action: AllocateAction = AllocateAction(
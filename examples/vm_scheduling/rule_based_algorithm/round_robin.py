@@ -1,3 +1,5 @@
+import numpy as np
+
 from maro.simulator import Env
 from maro.simulator.scenarios.vm_scheduling import AllocateAction, DecisionPayload
 
@@ -11,11 +13,10 @@ class RoundRobin(RuleBasedAlgorithm):
         self._pm_num: int = kwargs["env"].snapshot_list["pms"][kwargs["env"].frame_index::["cpu_cores_capacity"]].shape[0]
 
     def allocate_vm(self, decision_event: DecisionPayload, env: Env) -> AllocateAction:
-        # Choose the valid PM which index is next to the previous chose PM's index
-        chosen_idx: int = (self._prev_idx + 1) % self._pm_num
-        while chosen_idx not in decision_event.valid_pms:
-            chosen_idx += 1
-            chosen_idx %= self._pm_num
+        # Choose the valid PM which index is next to the previous chose PM's index, i.e., the one with the
+        # smallest cyclic distance from it, in a single vectorized pass instead of probing PM by PM.
+        valid_pms = np.asarray(decision_event.valid_pms)
+        chosen_idx: int = int(valid_pms[np.argmin((valid_pms - self._prev_idx - 1) % self._pm_num)])
         # Update the prev index
         self._prev_idx = chosen_idx
         # Take action to allocate on the chosen PM.
@@ -193,8 +193,10 @@ class VmSchedulingPipeline(DataPipeline):
             'vmcorecountbucket', 'vmmemorybucket'
         ]
 
-        vm_table = pd.read_csv(raw_vm_table_file, header=None, index_col=False, names=headers)
-        vm_table = vm_table.loc[:, required_headers]
+        # Only parse the required columns, the CPU utilization ones are not used by the VM table.
+        vm_table = pd.read_csv(
+            raw_vm_table_file, header=None, index_col=False, names=headers, usecols=required_headers
+        )
         # Convert to tick by dividing by 300 (5 minutes).
         vm_table['vmcreated'] = pd.to_numeric(vm_table['vmcreated'], errors="coerce", downcast="integer") // 300
         vm_table['vmdeleted'] = pd.to_numeric(vm_table['vmdeleted'], errors="coerce", downcast="integer") // 300
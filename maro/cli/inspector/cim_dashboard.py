@@ -553,7 +553,7 @@ def _render_intra_heat_map(
         snapshot_index (int): Selected snapshot index.
         prefix (str): Prefix of data folders.
     """
-    matrix_data = pd.read_csv(
+    matrix_data = helper.read_detail_csv(
         os.path.join(
             source_path,
             f"{prefix}{epoch_index}",
@@ -130,7 +130,7 @@ def render_intra_view(source_path: str, epoch_num: int, prefix: str):
             options=list(range(0, epoch_num))
         )
     helper.render_h1_title("Citi Bike Intra Epoch Data")
-    data_stations = pd.read_csv(os.path.join(source_path, f"{prefix}{selected_epoch}", "stations.csv"))
+    data_stations = helper.read_detail_csv(os.path.join(source_path, f"{prefix}{selected_epoch}", "stations.csv"))
     view_option = st.sidebar.selectbox(
         label="By station/snapshot:",
         options=CitiBikeIntraViewChoice._member_names_
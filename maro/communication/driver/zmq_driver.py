@@ -176,21 +176,46 @@ class ZmqDriver(AbsDriver):
             except Exception as e:
                 raise DriverReceiveError(f"Driver cannot receive message as {e}")
 
-            if self._unicast_receiver in sockets:
-                recv_message = self._unicast_receiver.recv_pyobj()
-                self._logger.debug(f"Receive a message from {recv_message.source} through unicast receiver.")
-            elif self._broadcast_receiver in sockets:
-                _, recv_message = self._broadcast_receiver.recv_multipart()
-                recv_message = pickle.loads(recv_message)
-                self._logger.debug(f"Receive a message from {recv_message.source} through broadcast receiver.")
-            else:
+            if not sockets:
                 self._logger.debug(f"Cannot receive any message within {receive_timeout}.")
                 return
 
-            yield recv_message
+            # Drain every message already queued on the ready sockets before polling again.
+            for recv_message in self._receive_ready(sockets):
+                yield recv_message
+
+                if not is_continuous:
+                    return
+
+    def _receive_ready(self, sockets: dict):
+        """Receive messages from the ready sockets without blocking until they are empty.
+
+        Messages are only taken off the sockets as they are consumed, so nothing is lost if the caller stops early.
+
+        Args:
+            sockets (dict): Ready sockets returned by ``zmq.Poller.poll``.
 
-            if not is_continuous:
-                break
+        Yields:
+            recv_message (Message): The received message from the ready sockets.
+        """
+        if self._unicast_receiver in sockets:
+            while True:
+                try:
+                    recv_message = self._unicast_receiver.recv_pyobj(flags=zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+                self._logger.debug(f"Receive a message from {recv_message.source} through unicast receiver.")
+                yield recv_message
+
+        if self._broadcast_receiver in sockets:
+            while True:
+                try:
+                    _, recv_message = self._broadcast_receiver.recv_multipart(flags=zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+                recv_message = pickle.loads(recv_message)
+                self._logger.debug(f"Receive a message from {recv_message.source} through broadcast receiver.")
+                yield recv_message
 
     def send(self, message: Message):
         """Send message.
@@ -253,7 +253,7 @@ class Proxy:
 
             self._onboard_peer_dict[peer_type] = {peer_name: None for peer_name in expected_peers_name}
 
-        self._onboard_peers_start_time = time.time()
+        self._onboard_peers_start_time = time.perf_counter()
 
     def _build_connection(self):
         """Grabbing all peers' address from Redis, and connect all peers in driver."""
@@ -294,6 +294,11 @@ class Proxy:
             peer_type: list(self._onboard_peer_dict[peer_type].keys()) for peer_type in self._peers_info_dict.keys()
         }
 
+    @property
+    def is_rejoin_enabled(self) -> bool:
+        """bool: Whether failed peers are allowed to rejoin."""
+        return self._enable_rejoin
+
     def receive(self, is_continuous: bool = True, timeout: int = None):
         """Receive messages from communication driver.
 
@@ -478,6 +483,11 @@ class Proxy:
     ) -> List[str]:
         """Broadcast message to all subscribers, and return list of message's session id.
 
+        Note:
+            Broadcast messages may be lost for peers that rejoin, since PUB/SUB drops messages to a subscriber whose
+            subscription has not arrived yet, and they also bypass the message cache for rejoining peers. Use
+            ``iscatter`` instead if rejoin is enabled.
+
         Args:
             component_type (str): Broadcast to all peers in this type.
             tag (str|Enum): Message's tag.
@@ -657,7 +667,7 @@ class Proxy:
         Update onboard peers with the peers on Redis, if onboard peers expired.
         If there are not enough peers for the given peer type, block until peers rejoin or timeout.
         """
-        current_time = time.time()
+        current_time = time.perf_counter()
 
         if current_time - self._onboard_peers_start_time > self._peers_catch_lifetime:
             self._check_peers_update()
@@ -668,12 +678,12 @@ class Proxy:
 
     def _wait_for_minimal_peer_number(self, peer_type):
         """Blocking until there are enough peers for the given peer type."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        while time.time() - start_time < self._timeout_for_minimal_peer_number:
+        while time.perf_counter() - start_time < self._timeout_for_minimal_peer_number:
             self._logger.warn(
                 f"No enough peers in {peer_type}! Wait for some peer restart. Remaining time: "
-                f"{start_time + self._timeout_for_minimal_peer_number - time.time()}"
+                f"{start_time + self._timeout_for_minimal_peer_number - time.perf_counter()}"
             )
             self._check_peers_update()
 
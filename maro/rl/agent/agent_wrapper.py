@@ -2,19 +2,61 @@
 # Licensed under the MIT license.
 
 import os
+from collections import defaultdict
 from typing import List, Union
 
+import numpy as np
+
 
 class MultiAgentWrapper:
-    """Multi-agent wrapper class that exposes the same interfaces as a single agent."""
-    def __init__(self, agent_dict: dict):
+    """Multi-agent wrapper class that exposes the same interfaces as a single agent.
+
+    Args:
+        agent_dict (dict): Agents by agent ID. Agent IDs may map to the same agent instance.
+        batch_shared_agents (bool): If True, states for agent IDs that map to the same agent instance are stacked
+            and passed to that agent in a single ``choose_action`` call. This requires the states to be same-shape
+            arrays and the agent's ``choose_action`` to handle a batch of states. The grouping of agent IDs by
+            instance is computed once at construction, so ``agent_dict`` should not be modified afterwards.
+            Defaults to False, in which case ``choose_action`` is called once per agent ID.
+    """
+    def __init__(self, agent_dict: dict, batch_shared_agents: bool = False):
         self.agent_dict = agent_dict
+        agent_ids_by_instance = defaultdict(list)
+        if batch_shared_agents:
+            for agent_id, agent in self.agent_dict.items():
+                agent_ids_by_instance[id(agent)].append(agent_id)
+        self._agent_ids_by_instance = list(agent_ids_by_instance.values())
+        self._has_shared_agents = any(len(agent_ids) > 1 for agent_ids in self._agent_ids_by_instance)
 
     def __getitem__(self, agent_id: str):
         return self.agent_dict[agent_id]
 
     def choose_action(self, state_by_agent: dict):
-        return {agent_id: self.agent_dict[agent_id].choose_action(state) for agent_id, state in state_by_agent.items()}
+        if not self._has_shared_agents:
+            return {
+                agent_id: self.agent_dict[agent_id].choose_action(state) for agent_id, state in state_by_agent.items()
+            }
+
+        action_by_agent = {}
+        for agent_ids in self._agent_ids_by_instance:
+            agent_ids = [agent_id for agent_id in agent_ids if agent_id in state_by_agent]
+            if not agent_ids:
+                continue
+
+            agent = self.agent_dict[agent_ids[0]]
+            if len(agent_ids) == 1:
+                action_by_agent[agent_ids[0]] = agent.choose_action(state_by_agent[agent_ids[0]])
+                continue
+
+            actions = agent.choose_action(np.stack([state_by_agent[agent_id] for agent_id in agent_ids]))
+            # Some agents return multiple outputs per state, e.g., actions and their log probabilities.
+            if isinstance(actions, tuple):
+                for i, agent_id in enumerate(agent_ids):
+                    action_by_agent[agent_id] = tuple(output[i] for output in actions)
+            else:
+                action_by_agent.update(zip(agent_ids, actions))
+
+        return {agent_id: action_by_agent[agent_id] for agent_id in state_by_agent}
 
     def set_exploration_params(self, params):
         # Per-agent exploration parameters
@@ -41,7 +83,7 @@ class MultiAgentWrapper:
         elif isinstance(agent_ids, str):
             return self.agent_dict[agent_ids].dump_model()
         else:
-            return {agent_id: self.agent_dict[agent_id].dump_model() for agent_id in self.agent_dict}
+            return {agent_id: self.agent_dict[agent_id].dump_model() for agent_id in agent_ids}
 
     def load_model_from_file(self, dir_path):
         """Load models from disk for each agent."""
@@ -87,13 +87,16 @@ class DQN(AbsAgent):
             return greedy_action.item() if is_single else greedy_action.numpy()
 
         if is_single:
-            return greedy_action if np.random.random() > self.config.epsilon else np.random.choice(num_actions)
-
-        # batch inference
-        return np.array([
-            act if np.random.random() > self.config.epsilon else np.random.choice(num_actions)
-            for act in greedy_action
-        ])
+            return greedy_action.item() if np.random.random() > self.config.epsilon else np.random.choice(num_actions)
+
+        # batch inference: draw the exploration decisions for the whole batch at once
+        greedy_action = greedy_action.numpy()
+        batch_size = len(greedy_action)
+        return np.where(
+            np.random.random(batch_size) > self.config.epsilon,
+            greedy_action,
+            np.random.randint(num_actions, size=batch_size)
+        )
 
     def learn(self, states: np.ndarray, actions: np.ndarray, rewards: np.ndarray, next_states: np.ndarray):
         states = torch.from_numpy(states)
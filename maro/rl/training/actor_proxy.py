@@ -52,6 +52,10 @@ class ActorProxy(object):
             training (bool): If true, the roll-out request is for training purposes.
             model_by_agent (dict): Models to be broadcast to remote actors for inference. Defaults to None.
             exploration_params: Exploration parameters to be used by the remote roll-out actors. Defaults to None.
+
+        Note:
+            Roll-out requests are broadcast to the actors unless rejoin is enabled for the internal proxy, in which
+            case they are scattered so that actors rejoining from failure still receive them.
         """
         payload = {
             PayloadKey.ROLLOUT_INDEX: index,
@@ -59,7 +63,14 @@ class ActorProxy(object):
             PayloadKey.MODEL: model_by_agent,
             PayloadKey.EXPLORATION_PARAMS: exploration_params
         }
-        self._proxy.iscatter(MessageTag.ROLLOUT, SessionType.TASK, [(actor, payload) for actor in self._actors])
+        # The payload (including the potentially large models) is the same for all actors, so broadcast it to have
+        # it serialized once rather than once per actor. Rejoined actors may miss broadcast messages, though.
+        if self._proxy.is_rejoin_enabled:
+            self._proxy.iscatter(MessageTag.ROLLOUT, SessionType.TASK, [(actor, payload) for actor in self._actors])
+        else:
+            self._proxy.ibroadcast(
+                component_type="actor", tag=MessageTag.ROLLOUT, session_type=SessionType.TASK, payload=payload
+            )
         self.logger.info(f"Sent roll-out requests to {self._actors} for ep-{index}")
 
         # Receive roll-out results from remote actors
@@ -2,6 +2,7 @@
 # Licensed under the MIT license.
 
 from collections import defaultdict
+from itertools import chain
 
 
 class ExperienceCollectionUtils:
@@ -24,17 +25,24 @@ class ExperienceCollectionUtils:
         if is_single_source:
             return exp
 
-        merged = defaultdict(list) if is_single_agent else defaultdict(lambda: defaultdict(list))
+        # Collect the parts from all sources first so that each field is concatenated only once.
+        parts = defaultdict(list) if is_single_agent else defaultdict(lambda: defaultdict(list))
         for ex in exp.values():
             if is_single_agent:
                 for k, v in ex.items():
-                    merged[k].extend[v]
+                    parts[k].append(v)
             else:
                 for agent_id, e in ex.items():
                     for k, v in e.items():
-                        merged[agent_id][k].extend(v)
+                        parts[agent_id][k].append(v)
 
-        return merged
+        if is_single_agent:
+            return {k: ExperienceCollectionUtils._concat_parts(v) for k, v in parts.items()}
+
+        return {
+            agent_id: {k: ExperienceCollectionUtils._concat_parts(v) for k, v in agent_parts.items()}
+            for agent_id, agent_parts in parts.items()
+        }
 
     @staticmethod
     def stack(exp, is_single_source: bool = False, is_single_agent: bool = False) -> dict:
@@ -60,3 +68,8 @@ class ExperienceCollectionUtils:
                 ret[agent_id].append(e)
 
         return ret
+
+    @staticmethod
+    def _concat_parts(parts: list) -> list:
+        # The result is always a list, as required by ``SimpleStore.put``, even if some parts are arrays.
+        return list(chain.from_iterable(parts))
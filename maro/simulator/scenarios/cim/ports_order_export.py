@@ -35,8 +35,8 @@ class PortOrderExporter:
                     ["tick", "src_port_idx", "dest_port_idx", "quantity"]
                 )
 
-                for order in self._orders:
-                    writer.writerow(
-                        [order.tick, order.src_port_idx, order.dest_port_idx, order.quantity])
+                writer.writerows(
+                    (order.tick, order.src_port_idx, order.dest_port_idx, order.quantity) for order in self._orders
+                )
 
             self._orders.clear()
@@ -0,0 +1,81 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT license.
+
+import unittest
+
+import numpy as np
+
+from maro.rl import MultiAgentWrapper
+
+
+class StubAgent:
+    """Agent stub that records the states it receives and returns the state sum as the action."""
+    def __init__(self, with_log_p: bool = False):
+        self.with_log_p = with_log_p
+        self.received = []
+
+    def choose_action(self, state):
+        self.received.append(state)
+        action = state.sum(axis=-1)
+        if self.with_log_p:
+            return action, -action
+        return action
+
+
+class TestMultiAgentWrapper(unittest.TestCase):
+    def test_shared_agent_batching(self):
+        shared, single = StubAgent(), StubAgent()
+        wrapper = MultiAgentWrapper({"a": shared, "b": single, "c": shared, "d": shared}, batch_shared_agents=True)
+        state_by_agent = {
+            "d": np.asarray([1, 2]), "b": np.asarray([3, 4]), "a": np.asarray([5, 6]), "c": np.asarray([7, 8])
+        }
+        action_by_agent = wrapper.choose_action(state_by_agent)
+
+        # The shared agent is called once with the states of its agent IDs stacked in construction order.
+        self.assertEqual(len(shared.received), 1)
+        np.testing.assert_array_equal(shared.received[0], [[5, 6], [7, 8], [1, 2]])
+        self.assertEqual(len(single.received), 1)
+        np.testing.assert_array_equal(single.received[0], [3, 4])
+
+        self.assertEqual(list(action_by_agent.keys()), ["d", "b", "a", "c"])
+        self.assertEqual({agent_id: int(action) for agent_id, action in action_by_agent.items()},
+                         {"a": 11, "b": 7, "c": 15, "d": 3})
+
+    def test_shared_agent_batching_with_tuple_outputs(self):
+        shared = StubAgent(with_log_p=True)
+        wrapper = MultiAgentWrapper({"a": shared, "b": shared}, batch_shared_agents=True)
+        action_by_agent = wrapper.choose_action({"b": np.asarray([1, 2]), "a": np.asarray([3, 4])})
+
+        self.assertEqual(len(shared.received), 1)
+        self.assertEqual(list(action_by_agent.keys()), ["b", "a"])
+        for agent_id, expected in (("a", 7), ("b", 3)):
+            self.assertIsInstance(action_by_agent[agent_id], tuple)
+            action, log_p = action_by_agent[agent_id]
+            self.assertEqual((int(action), int(log_p)), (expected, -expected))
+
+    def test_shared_agent_batching_with_partial_states(self):
+        shared = StubAgent()
+        wrapper = MultiAgentWrapper({"a": shared, "b": shared, "c": shared}, batch_shared_agents=True)
+        action_by_agent = wrapper.choose_action({"c": np.asarray([1, 2]), "a": np.asarray([3, 4])})
+
+        np.testing.assert_array_equal(shared.received[0], [[3, 4], [1, 2]])
+        self.assertEqual(list(action_by_agent.keys()), ["c", "a"])
+        self.assertEqual(int(action_by_agent["c"]), 3)
+        self.assertEqual(int(action_by_agent["a"]), 7)
+
+    def test_shared_agent_without_batching(self):
+        shared = StubAgent()
+        wrapper = MultiAgentWrapper({"a": shared, "b": shared})
+        action_by_agent = wrapper.choose_action({"b": np.asarray([1, 2]), "a": np.asarray([3, 4])})
+
+        # By default, the shared agent is called once per agent ID with unstacked states.
+        self.assertEqual(len(shared.received), 2)
+        np.testing.assert_array_equal(shared.received[0], [1, 2])
+        np.testing.assert_array_equal(shared.received[1], [3, 4])
+        self.assertEqual(list(action_by_agent.keys()), ["b", "a"])
+        self.assertEqual(int(action_by_agent["b"]), 3)
+        self.assertEqual(int(action_by_agent["a"]), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
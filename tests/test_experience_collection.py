@@ -0,0 +1,58 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT license.
+
+import unittest
+
+import numpy as np
+
+from maro.rl import SimpleStore
+from maro.rl.utils import ExperienceCollectionUtils
+
+
+class TestExperienceCollectionUtils(unittest.TestCase):
+    def test_concat_single_agent_multi_source(self):
+        exp = {
+            "actor_0": {"S": [1, 2], "A": [10, 20]},
+            "actor_1": {"S": [3], "A": [30]},
+            "actor_2": {"S": [4, 5], "A": [40, 50]}
+        }
+        merged = ExperienceCollectionUtils.concat(exp, is_single_agent=True)
+        self.assertEqual(merged, {"S": [1, 2, 3, 4, 5], "A": [10, 20, 30, 40, 50]})
+        self.assertEqual(list(merged.keys()), ["S", "A"])
+
+    def test_concat_multi_agent_multi_source(self):
+        exp = {
+            "actor_0": {"agent_0": {"S": [1], "A": [10]}, "agent_1": {"S": [2, 3], "A": [20, 30]}},
+            "actor_1": {"agent_0": {"S": [4, 5], "A": [40, 50]}, "agent_1": {"S": [6], "A": [60]}}
+        }
+        merged = ExperienceCollectionUtils.concat(exp)
+        self.assertEqual(list(merged.keys()), ["agent_0", "agent_1"])
+        self.assertEqual(merged["agent_0"], {"S": [1, 4, 5], "A": [10, 40, 50]})
+        self.assertEqual(merged["agent_1"], {"S": [2, 3, 6], "A": [20, 30, 60]})
+        for agent_exp in merged.values():
+            self.assertEqual(list(agent_exp.keys()), ["S", "A"])
+            self.assertEqual(len(agent_exp["S"]), len(agent_exp["A"]))
+
+    def test_concat_single_source(self):
+        exp = {"agent_0": {"S": [1, 2], "A": [10, 20]}}
+        self.assertIs(ExperienceCollectionUtils.concat(exp, is_single_source=True), exp)
+
+    def test_concat_array_fields_into_store(self):
+        exp = {
+            "actor_0": {"agent_0": {"S": np.asarray([[1, 2], [3, 4]]), "A": np.asarray([0, 1])}},
+            "actor_1": {"agent_0": {"S": np.asarray([[5, 6]]), "A": np.asarray([2])}}
+        }
+        merged = ExperienceCollectionUtils.concat(exp)
+        self.assertIsInstance(merged["agent_0"]["S"], list)
+        self.assertIsInstance(merged["agent_0"]["A"], list)
+
+        store = SimpleStore(["S", "A"])
+        indexes = store.put(merged["agent_0"])
+        self.assertEqual(indexes, [0, 1, 2])
+        self.assertEqual(len(store), 3)
+        np.testing.assert_array_equal(np.asarray(store.get_by_key("S")), [[1, 2], [3, 4], [5, 6]])
+        self.assertEqual(list(store.get_by_key("A")), [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()